@@ -11,10 +11,6 @@ from eth_typing.abi import (
 
 from eth_abi.decoding import (
     ContextFramesBytesIO,
-    TupleDecoder,
-)
-from eth_abi.encoding import (
-    TupleEncoder,
 )
 from eth_abi.exceptions import (
     EncodingError,
@@ -65,12 +61,7 @@ class ABIEncoder(BaseABICoder):
         validate_list_like_param(types, 'types')
         validate_list_like_param(args, 'args')
 
-        encoders = [
-            self._registry.get_encoder(type_str)
-            for type_str in types
-        ]
-
-        encoder = TupleEncoder(encoders=encoders)
+        encoder = self._registry.get_tuple_encoder(*types)
 
         return encoder(args)
 
@@ -138,12 +129,7 @@ class ABIDecoder(BaseABICoder):
         validate_list_like_param(types, 'types')
         validate_bytes_param(data, 'data')
 
-        decoders = [
-            self._registry.get_decoder(type_str)
-            for type_str in types
-        ]
-
-        decoder = TupleDecoder(decoders=decoders)
+        decoder = self._registry.get_tuple_decoder(*types)
         stream = self.stream_class(data)
 
         return decoder(stream)
@@ -1,14 +1,13 @@
 import abc
 import decimal
 import io
+import sys
 from typing import (
     Any,
 )
 
 from eth_utils import (
     big_endian_to_int,
-    to_normalized_address,
-    to_tuple,
 )
 
 from eth_abi.base import (
@@ -24,7 +23,6 @@ from eth_abi.exceptions import (
 from eth_abi.utils.numeric import (
     TEN,
     abi_decimal_context,
-    ceil32,
 )
 
 
@@ -167,10 +165,8 @@ class TupleDecoder(BaseDecoder):
         if self.decoders is None:
             raise ValueError("No `decoders` set")
 
-    @to_tuple
     def decode(self, stream):
-        for decoder in self.decoders:
-            yield decoder(stream)
+        return tuple([decoder(stream) for decoder in self.decoders])
 
     @parse_tuple_type_str
     def from_type_str(cls, abi_type, registry):
@@ -221,12 +217,27 @@ class BaseArrayDecoder(BaseDecoder):
                 tail_decoder=self.item_decoder,
             )
 
+        # Items of a plain unsigned integer array are laid out back to back
+        # so they can be read from the stream in one go
+        self._has_uint_items = type(self.item_decoder) is UnsignedIntegerDecoder
+
     def validate(self):
         super().validate()
 
         if self.item_decoder is None:
             raise ValueError("No `item_decoder` set")
 
+    def _decode_items(self, stream, array_size):
+        if self._has_uint_items:
+            return self.item_decoder.decode_sequence(stream, array_size)
+
+        return self._decode_each_item(stream, array_size)
+
+    def _decode_each_item(self, stream, array_size):
+        item_decoder = self.item_decoder
+
+        return tuple([item_decoder(stream) for _ in range(array_size)])
+
     @parse_type_str(with_arrlist=True)
     def from_type_str(cls, abi_type, registry):
         item_decoder = registry.get_decoder(abi_type.item_type.to_type_str())
@@ -251,24 +262,22 @@ class SizedArrayDecoder(BaseArrayDecoder):
 
         self.is_dynamic = self.item_decoder.is_dynamic
 
-    @to_tuple
     def decode(self, stream):
-        for _ in range(self.array_size):
-            yield self.item_decoder(stream)
+        return self._decode_items(stream, self.array_size)
 
 
 class DynamicArrayDecoder(BaseArrayDecoder):
     # Dynamic arrays are always dynamic, regardless of their elements
     is_dynamic = True
 
-    @to_tuple
     def decode(self, stream):
         array_size = decode_uint_256(stream)
         stream.push_frame(32)
-        for _ in range(array_size):
-            yield self.item_decoder(stream)
+        values = self._decode_items(stream, array_size)
         stream.pop_frame()
 
+        return values
+
 
 class FixedByteSizeDecoder(SingleDecoder):
     decoder_fn = None
@@ -298,13 +307,20 @@ class FixedByteSizeDecoder(SingleDecoder):
         if self.value_bit_size > self.data_byte_size * 8:
             raise ValueError("Value byte size exceeds data size")
 
+        # Value and padding sizes are fixed for a given decoder so compute
+        # them, and the expected padding, once here rather than on every decode
+        self._value_byte_size = self._get_value_byte_size()
+        self._padding_size = self.data_byte_size - self._value_byte_size
+        self._zero_padding_bytes = b'\x00' * self._padding_size
+
     def read_data_from_stream(self, stream):
-        data = stream.read(self.data_byte_size)
+        data_byte_size = self.data_byte_size
+        data = stream.read(data_byte_size)
 
-        if len(data) != self.data_byte_size:
+        if len(data) != data_byte_size:
             raise InsufficientDataBytes(
                 "Tried to read {0} bytes.  Only got {1} bytes".format(
-                    self.data_byte_size,
+                    data_byte_size,
                     len(data),
                 )
             )
@@ -312,23 +328,19 @@ class FixedByteSizeDecoder(SingleDecoder):
         return data
 
     def split_data_and_padding(self, raw_data):
-        value_byte_size = self._get_value_byte_size()
-        padding_size = self.data_byte_size - value_byte_size
-
         if self.is_big_endian:
+            padding_size = self._padding_size
             padding_bytes = raw_data[:padding_size]
             data = raw_data[padding_size:]
         else:
+            value_byte_size = self._value_byte_size
             data = raw_data[:value_byte_size]
             padding_bytes = raw_data[value_byte_size:]
 
         return data, padding_bytes
 
     def validate_padding_bytes(self, value, padding_bytes):
-        value_byte_size = self._get_value_byte_size()
-        padding_size = self.data_byte_size - value_byte_size
-
-        if padding_bytes != b'\x00' * padding_size:
+        if padding_bytes != self._zero_padding_bytes:
             raise NonEmptyPaddingBytes(
                 "Padding bytes were not empty: {0}".format(repr(padding_bytes))
             )
@@ -348,15 +360,15 @@ class BooleanDecoder(Fixed32ByteSizeDecoder):
 
     @staticmethod
     def decoder_fn(data):
-        if data == b'\x00':
-            return False
-        elif data == b'\x01':
-            return True
-        else:
+        byte_value = data[0]
+
+        if byte_value > 1:
             raise NonEmptyPaddingBytes(
                 "Boolean must be either 0x0 or 0x1.  Got: {0}".format(repr(data))
             )
 
+        return (False, True)[byte_value]
+
     @parse_type_str('bool')
     def from_type_str(cls, abi_type, registry):
         return cls()
@@ -365,7 +377,12 @@ class BooleanDecoder(Fixed32ByteSizeDecoder):
 class AddressDecoder(Fixed32ByteSizeDecoder):
     value_bit_size = 20 * 8
     is_big_endian = True
-    decoder_fn = staticmethod(to_normalized_address)
+
+    @staticmethod
+    def decoder_fn(data):
+        # Equivalent to ``to_normalized_address`` for the 20 byte values
+        # produced by this decoder without its format detection and validation
+        return '0x' + data.hex()
 
     @parse_type_str('address')
     def from_type_str(cls, abi_type, registry):
@@ -379,6 +396,77 @@ class UnsignedIntegerDecoder(Fixed32ByteSizeDecoder):
     decoder_fn = staticmethod(big_endian_to_int)
     is_big_endian = True
 
+    def decode(self, stream):
+        # Subclasses may customize any of the hooks used by
+        # ``SingleDecoder.decode`` so only this exact class takes the fused path
+        if type(self) is not UnsignedIntegerDecoder:
+            return super().decode(stream)
+
+        # Unsigned integers are always big endian and zero padded so the read,
+        # padding check, and conversion are done in one pass without the
+        # intermediate split performed by ``SingleDecoder.decode``
+        data_byte_size = self.data_byte_size
+        data = stream.read(data_byte_size)
+
+        if len(data) != data_byte_size:
+            raise InsufficientDataBytes(
+                "Tried to read {0} bytes.  Only got {1} bytes".format(
+                    data_byte_size,
+                    len(data),
+                )
+            )
+
+        padding_size = self._padding_size
+        if padding_size:
+            padding_bytes = data[:padding_size]
+            if padding_bytes != self._zero_padding_bytes:
+                raise NonEmptyPaddingBytes(
+                    "Padding bytes were not empty: {0}".format(repr(padding_bytes))
+                )
+            data = data[padding_size:]
+
+        return self.decoder_fn(data)
+
+    def decode_sequence(self, stream, count):
+        """
+        Decodes ``count`` consecutive unsigned integers from the given stream
+        with a single read.  Equivalent to calling :meth:`decode` ``count``
+        times: every complete item is padding checked in order before a short
+        read is reported.
+        """
+        data_byte_size = self.data_byte_size
+        total_size = data_byte_size * count
+        # Counts taken from encoded data may be far larger than any stream.
+        # A read never returns more than the stream holds so the count cannot
+        # drive the allocation size; the cap only keeps the argument in range.
+        data = stream.read(min(total_size, sys.maxsize))
+        complete_size = len(data) - len(data) % data_byte_size
+
+        decoder_fn = self.decoder_fn
+        padding_size = self._padding_size
+        zero_padding_bytes = self._zero_padding_bytes
+
+        values = []
+        for start in range(0, complete_size, data_byte_size):
+            value_start = start + padding_size
+            if padding_size:
+                padding_bytes = data[start:value_start]
+                if padding_bytes != zero_padding_bytes:
+                    raise NonEmptyPaddingBytes(
+                        "Padding bytes were not empty: {0}".format(repr(padding_bytes))
+                    )
+            values.append(decoder_fn(data[value_start:start + data_byte_size]))
+
+        if len(data) != total_size:
+            raise InsufficientDataBytes(
+                "Tried to read {0} bytes.  Only got {1} bytes".format(
+                    total_size,
+                    len(data),
+                )
+            )
+
+        return tuple(values)
+
     @parse_type_str('uint')
     def from_type_str(cls, abi_type, registry):
         return cls(value_bit_size=abi_type.sub)
@@ -390,30 +478,43 @@ decode_uint_256 = UnsignedIntegerDecoder(value_bit_size=256)
 #
 # Signed Integer Decoders
 #
-class SignedIntegerDecoder(Fixed32ByteSizeDecoder):
-    is_big_endian = True
+class SignedDecoderMixin:
+    """
+    Two's complement handling shared by the signed integer and signed fixed
+    point decoders.
+    """
 
-    def decoder_fn(self, data):
-        value = big_endian_to_int(data)
-        if value >= 2 ** (self.value_bit_size - 1):
-            return value - 2 ** self.value_bit_size
+    def validate(self):
+        super().validate()
+
+        self._sign_bit_value = 2 ** (self.value_bit_size - 1)
+        self._value_range = 2 ** self.value_bit_size
+        self._negative_padding_bytes = b'\xff' * self._padding_size
+
+    def to_signed(self, value):
+        if value >= self._sign_bit_value:
+            return value - self._value_range
         else:
             return value
 
     def validate_padding_bytes(self, value, padding_bytes):
-        value_byte_size = self._get_value_byte_size()
-        padding_size = self.data_byte_size - value_byte_size
-
         if value >= 0:
-            expected_padding_bytes = b'\x00' * padding_size
+            expected_padding_bytes = self._zero_padding_bytes
         else:
-            expected_padding_bytes = b'\xff' * padding_size
+            expected_padding_bytes = self._negative_padding_bytes
 
         if padding_bytes != expected_padding_bytes:
             raise NonEmptyPaddingBytes(
                 "Padding bytes were not empty: {0}".format(repr(padding_bytes))
             )
 
+
+class SignedIntegerDecoder(SignedDecoderMixin, Fixed32ByteSizeDecoder):
+    is_big_endian = True
+
+    def decoder_fn(self, data):
+        return self.to_signed(int.from_bytes(data, 'big'))
+
     @parse_type_str('int')
     def from_type_str(cls, abi_type, registry):
         return cls(value_bit_size=abi_type.sub)
@@ -447,15 +548,17 @@ class BaseFixedDecoder(Fixed32ByteSizeDecoder):
         if self.frac_places <= 0 or self.frac_places > 80:
             raise ValueError("`frac_places` must be in range (0, 80]")
 
+        with decimal.localcontext(abi_decimal_context):
+            self._scaling_divisor = TEN ** self.frac_places
+
 
 class UnsignedFixedDecoder(BaseFixedDecoder):
     def decoder_fn(self, data):
-        value = big_endian_to_int(data)
-
-        with decimal.localcontext(abi_decimal_context):
-            decimal_value = decimal.Decimal(value) / TEN ** self.frac_places
+        value = int.from_bytes(data, 'big')
 
-        return decimal_value
+        # Dividing through the context avoids switching the thread's active
+        # context on every decode
+        return abi_decimal_context.divide(value, self._scaling_divisor)
 
     @parse_type_str('ufixed')
     def from_type_str(cls, abi_type, registry):
@@ -464,32 +567,11 @@ class UnsignedFixedDecoder(BaseFixedDecoder):
         return cls(value_bit_size=value_bit_size, frac_places=frac_places)
 
 
-class SignedFixedDecoder(BaseFixedDecoder):
+class SignedFixedDecoder(SignedDecoderMixin, BaseFixedDecoder):
     def decoder_fn(self, data):
-        value = big_endian_to_int(data)
-        if value >= 2 ** (self.value_bit_size - 1):
-            signed_value = value - 2 ** self.value_bit_size
-        else:
-            signed_value = value
-
-        with decimal.localcontext(abi_decimal_context):
-            decimal_value = decimal.Decimal(signed_value) / TEN ** self.frac_places
-
-        return decimal_value
+        signed_value = self.to_signed(int.from_bytes(data, 'big'))
 
-    def validate_padding_bytes(self, value, padding_bytes):
-        value_byte_size = self._get_value_byte_size()
-        padding_size = self.data_byte_size - value_byte_size
-
-        if value >= 0:
-            expected_padding_bytes = b'\x00' * padding_size
-        else:
-            expected_padding_bytes = b'\xff' * padding_size
-
-        if padding_bytes != expected_padding_bytes:
-            raise NonEmptyPaddingBytes(
-                "Padding bytes were not empty: {0}".format(repr(padding_bytes))
-            )
+        return abi_decimal_context.divide(signed_value, self._scaling_divisor)
 
     @parse_type_str('fixed')
     def from_type_str(cls, abi_type, registry):
@@ -511,26 +593,29 @@ class ByteStringDecoder(SingleDecoder):
     @staticmethod
     def read_data_from_stream(stream):
         data_length = decode_uint_256(stream)
-        padded_length = ceil32(data_length)
+        # Number of bytes needed to pad the value to a multiple of 32
+        padding_size = -data_length % 32
 
-        data = stream.read(padded_length)
+        # Read the value and its padding separately so the value doesn't need
+        # to be copied out of the padded data
+        data = stream.read(data_length)
+        padding_bytes = stream.read(padding_size)
+        read_length = len(data) + len(padding_bytes)
 
-        if len(data) < padded_length:
+        if read_length < data_length + padding_size:
             raise InsufficientDataBytes(
                 "Tried to read {0} bytes.  Only got {1} bytes".format(
-                    padded_length,
-                    len(data),
+                    data_length + padding_size,
+                    read_length,
                 )
             )
 
-        padding_bytes = data[data_length:]
-
-        if padding_bytes != b'\x00' * (padded_length - data_length):
+        if any(padding_bytes):
             raise NonEmptyPaddingBytes(
                 "Padding bytes were not empty: {0}".format(repr(padding_bytes))
             )
 
-        return data[:data_length]
+        return data
 
     def validate_padding_bytes(self, value, padding_bytes):
         pass
@@ -104,7 +104,10 @@ class TupleEncoder(BaseEncoder):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        self.is_dynamic = any(getattr(e, 'is_dynamic', False) for e in self.encoders)
+        self._encoders_are_dynamic = tuple(
+            getattr(e, 'is_dynamic', False) for e in self.encoders
+        )
+        self.is_dynamic = any(self._encoders_are_dynamic)
 
     def validate(self):
         super().validate()
@@ -140,8 +143,12 @@ class TupleEncoder(BaseEncoder):
 
         raw_head_chunks = []
         tail_chunks = []
-        for value, encoder in zip(values, self.encoders):
-            if getattr(encoder, 'is_dynamic', False):
+        for value, encoder, is_dynamic in zip(
+            values,
+            self.encoders,
+            self._encoders_are_dynamic,
+        ):
+            if is_dynamic:
                 raw_head_chunks.append(None)
                 tail_chunks.append(encoder(value))
             else:
@@ -413,10 +413,11 @@ TYPE_ALIAS_RE = re.compile(r'\b({})\b'.format(
 ))
 
 
+@functools.lru_cache(maxsize=None)
 def normalize(type_str):
     """
     Normalizes a type string into its canonical version e.g. the type string
-    'int' becomes 'int256', etc.
+    'int' becomes 'int256', etc.  Normalization operations are cached.
 
     :param type_str: The type string to be normalized.
     :returns: The canonical version of the input type string.
@@ -284,6 +284,7 @@ def _clear_encoder_cache(old_method):
     @functools.wraps(old_method)
     def new_method(self, *args, **kwargs):
         self.get_encoder.cache_clear()
+        self.get_tuple_encoder.cache_clear()
         return old_method(self, *args, **kwargs)
 
     return new_method
@@ -293,6 +294,7 @@ def _clear_decoder_cache(old_method):
     @functools.wraps(old_method)
     def new_method(self, *args, **kwargs):
         self.get_decoder.cache_clear()
+        self.get_tuple_decoder.cache_clear()
         return old_method(self, *args, **kwargs)
 
     return new_method
@@ -455,6 +457,21 @@ class ABIRegistry(Copyable, BaseRegistry):
     def get_encoder(self, type_str):
         return self._get_registration(self._encoders, type_str)
 
+    @functools.lru_cache(maxsize=None)
+    def get_tuple_encoder(self, *type_strs):
+        """
+        Returns a :class:`~eth_abi.encoding.TupleEncoder` which encodes a
+        sequence of values as values of the ABI types in ``type_strs`` via the
+        head-tail mechanism.  Results are cached so that repeated encodings
+        for the same sequence of types share a single encoder instance.
+        """
+        encoders = tuple(
+            self.get_encoder(type_str)
+            for type_str in type_strs
+        )
+
+        return encoding.TupleEncoder(encoders=encoders)
+
     def has_encoder(self, type_str: abi.TypeStr) -> bool:
         """
         Returns ``True`` if an encoder is found for the given type string
@@ -473,6 +490,21 @@ class ABIRegistry(Copyable, BaseRegistry):
     def get_decoder(self, type_str):
         return self._get_registration(self._decoders, type_str)
 
+    @functools.lru_cache(maxsize=None)
+    def get_tuple_decoder(self, *type_strs):
+        """
+        Returns a :class:`~eth_abi.decoding.TupleDecoder` which decodes a
+        sequence of values of the ABI types in ``type_strs`` via the head-tail
+        mechanism.  Results are cached so that repeated decodings for the same
+        sequence of types share a single decoder instance.
+        """
+        decoders = tuple(
+            self.get_decoder(type_str)
+            for type_str in type_strs
+        )
+
+        return decoding.TupleDecoder(decoders=decoders)
+
     def copy(self):
         """
         Copies a registry such that new registrations can be made or existing
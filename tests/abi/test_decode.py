@@ -6,29 +6,21 @@ from eth_abi.abi import (
 from eth_abi.exceptions import (
     InsufficientDataBytes,
 )
-from eth_abi.grammar import (
-    parse,
-)
 
 from ..common.unit import (
     CORRECT_DYNAMIC_ENCODINGS,
     CORRECT_STATIC_ENCODINGS,
     CORRECT_TUPLE_ENCODINGS,
+    split_tuple_encodings,
     words,
 )
 
 
 @pytest.mark.parametrize(
-    'type_str,expected,abi_encoding,_',
-    CORRECT_TUPLE_ENCODINGS,
+    'types,expected,abi_encoding',
+    split_tuple_encodings(CORRECT_TUPLE_ENCODINGS),
 )
-def test_decode_abi_for_multiple_types_as_list(type_str, expected, abi_encoding, _):
-    abi_type = parse(type_str)
-    if abi_type.arrlist is not None:
-        pytest.skip('ABI coding functions do not support array types')
-
-    types = [t.to_type_str() for t in abi_type.components]
-
+def test_decode_abi_for_multiple_types_as_list(types, expected, abi_encoding):
     actual = decode(types, abi_encoding)
     assert actual == expected
 
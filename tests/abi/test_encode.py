@@ -3,29 +3,23 @@ import pytest
 from eth_abi import (
     encode,
 )
-from eth_abi.grammar import (
-    parse,
-)
 
 from ..common.unit import (
     CORRECT_DYNAMIC_ENCODINGS,
     CORRECT_STATIC_ENCODINGS,
     CORRECT_TUPLE_ENCODINGS,
+    split_tuple_encodings,
     words,
 )
 
 
 @pytest.mark.parametrize(
-    'tuple_type,python_value,solidity_abi_encoded,_',
-    CORRECT_TUPLE_ENCODINGS,
+    'separated_list_of_types,python_value,solidity_abi_encoded',
+    split_tuple_encodings(CORRECT_TUPLE_ENCODINGS),
 )
 def test_abi_encode_for_multiple_types_as_list(
-    tuple_type, python_value, solidity_abi_encoded, _
+    separated_list_of_types, python_value, solidity_abi_encoded
 ):
-    abi_type = parse(tuple_type)
-    if abi_type.arrlist is not None:
-        pytest.skip('ABI coding functions do not support array types')
-
     # assert different types encoded correctly as a list
     # e.g. encode(['bytes32[]', 'uint256'], ([b'a', b'b'], 22))
     #
@@ -36,7 +30,6 @@ def test_abi_encode_for_multiple_types_as_list(
     #   uint256 num = 22;
     #
     #   abi.encode(arr,num);
-    separated_list_of_types = [t.to_type_str() for t in abi_type.components]
     eth_abi_encoded = encode(separated_list_of_types, python_value)
 
     assert eth_abi_encoded == solidity_abi_encoded
@@ -6,7 +6,11 @@ import re
 from eth_utils import (
     decode_hex,
 )
+import pytest
 
+from eth_abi.grammar import (
+    parse,
+)
 from eth_abi.utils.padding import (
     zpad32_right,
 )
@@ -343,6 +347,26 @@ CORRECT_DYNAMIC_TUPLE_ENCODINGS = [
 
 CORRECT_TUPLE_ENCODINGS = CORRECT_STATIC_TUPLE_ENCODINGS + CORRECT_DYNAMIC_TUPLE_ENCODINGS
 
+
+def split_tuple_encodings(tuple_encodings):
+    """
+    Converts tuple encoding cases into ``pytest.param`` cases of (list of
+    component type strings, python value, abi encoding) for testing the ABI
+    coding functions.  Tuple array types are marked as skipped since those
+    functions do not support them.
+    """
+    for type_str, python_value, abi_encoding, _ in tuple_encodings:
+        abi_type = parse(type_str)
+        types = [t.to_type_str() for t in abi_type.components]
+
+        if abi_type.arrlist is not None:
+            marks = pytest.mark.skip('ABI coding functions do not support array types')
+        else:
+            marks = ()
+
+        yield pytest.param(types, python_value, abi_encoding, marks=marks, id=type_str)
+
+
 CORRECT_STATIC_SINGLE_ENCODINGS = [
     #####
     # (type string, python value, abi encoding, packed encoding)
@@ -47,3 +47,18 @@ def test_pushing_and_popping_frames(byte_string, byte_stream):
 
     with pytest.raises(IndexError):
         byte_stream.pop_frame()
+
+
+def test_push_frame_seeks_through_seek_in_frame(byte_string):
+    seeks = []
+
+    class RecordingBytesIO(ContextFramesBytesIO):
+        def seek_in_frame(self, pos, *args, **kwargs):
+            seeks.append(pos)
+            super().seek_in_frame(pos, *args, **kwargs)
+
+    byte_stream = RecordingBytesIO(byte_string)
+    byte_stream.push_frame(5)
+
+    assert seeks == [0]
+    assert byte_stream.read(1) == byte_string[5:6]
@@ -1,7 +1,6 @@
-import sys
+import functools
 
 from eth_utils import (
-    big_endian_to_int,
     decode_hex,
     int_to_big_endian,
     to_normalized_address,
@@ -10,6 +9,7 @@ from eth_utils.toolz import (
     complement,
 )
 from hypothesis import (
+    HealthCheck,
     example,
     given,
     settings,
@@ -29,6 +29,7 @@ from eth_abi.decoding import (
     DynamicArrayDecoder,
     SignedFixedDecoder,
     SignedIntegerDecoder,
+    SizedArrayDecoder,
     StringDecoder,
     TupleDecoder,
     UnsignedFixedDecoder,
@@ -49,6 +50,27 @@ from eth_abi.utils.padding import (
     zpad32,
 )
 
+# Powers of two for every valid integer bit size
+POWERS_OF_TWO = {
+    bit_size: 2 ** bit_size
+    for bit_size in range(8, 257, 8)
+}
+
+# Shared by every property test below.  Bignum-heavy examples can be slow, so
+# the deadline and slow-data health checks only add per-example overhead.
+decoder_settings = settings(
+    max_examples=200,
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow, HealthCheck.data_too_large],
+)
+
+
+@functools.lru_cache(maxsize=None)
+def cached_decoder(decoder_class, **kwargs):
+    # Decoders hold no per-decode state so one instance per configuration can
+    # be shared by all hypothesis examples
+    return decoder_class(**kwargs)
+
 
 def is_utf8_decodable(value):
     try:
@@ -67,7 +89,7 @@ def is_utf8_encodable(value):
 
 
 def is_non_empty_non_null_byte_string(value):
-    return value and big_endian_to_int(value) != 0
+    return any(value)
 
 
 def is_valid_padding_bytes(padding_bytes, data_bytes):
@@ -89,48 +111,38 @@ def is_valid_padding_bytes(padding_bytes, data_bytes):
     return False
 
 
-def all_bytes_equal(test_bytes, target):
-    if sys.version_info.major < 3:
-        return all(byte == chr(target) for byte in test_bytes)
-    else:
-        return all(byte == target for byte in test_bytes)
-
-
-@settings(max_examples=250)
+@decoder_settings
 @given(
     integer_bit_size=st.integers(min_value=1, max_value=32).map(lambda v: v * 8),
-    stream_bytes=st.binary(min_size=0, max_size=32),
+    stream_bytes=st.binary(min_size=32, max_size=32),
     data_byte_size=st.integers(min_value=0, max_value=32),
 )
+@example(256, b'\x00' * 32, 32)
+@example(256, b'\xff' * 32, 32)
+@example(8, b'\x00' * 31 + b'\xff', 32)
+@example(8, b'\x01' + b'\x00' * 31, 32)
 def test_decode_unsigned_int(integer_bit_size, stream_bytes, data_byte_size):
-    if integer_bit_size % 8 != 0:
-        with pytest.raises(ValueError):
-            UnsignedIntegerDecoder(
-                value_bit_size=integer_bit_size,
-                data_byte_size=data_byte_size,
-            )
-        return
-    elif integer_bit_size > data_byte_size * 8:
-        with pytest.raises(ValueError):
-            UnsignedIntegerDecoder(
-                value_bit_size=integer_bit_size,
-                data_byte_size=data_byte_size,
-            )
-        return
-    else:
-        decoder = UnsignedIntegerDecoder(
+    is_valid_size = (
+        integer_bit_size % 8 == 0 and
+        integer_bit_size <= data_byte_size * 8
+    )
+
+    try:
+        decoder = cached_decoder(
+            UnsignedIntegerDecoder,
             value_bit_size=integer_bit_size,
             data_byte_size=data_byte_size,
         )
+    except ValueError:
+        assert not is_valid_size
+        return
+
+    assert is_valid_size
 
     stream = ContextFramesBytesIO(stream_bytes)
-    actual_value = big_endian_to_int(stream_bytes[:data_byte_size])
+    actual_value = int.from_bytes(stream_bytes[:data_byte_size], 'big')
 
-    if len(stream_bytes) < data_byte_size:
-        with pytest.raises(InsufficientDataBytes):
-            decoder(stream)
-        return
-    elif actual_value > 2 ** integer_bit_size - 1:
+    if actual_value >= POWERS_OF_TWO[integer_bit_size]:
         with pytest.raises(NonEmptyPaddingBytes):
             decoder(stream)
         return
@@ -140,52 +152,59 @@ def test_decode_unsigned_int(integer_bit_size, stream_bytes, data_byte_size):
     assert decoded_value == actual_value
 
 
-@settings(max_examples=250)
+def test_decode_unsigned_int_subclass_hooks_are_used():
+    class LenientUnsignedIntegerDecoder(UnsignedIntegerDecoder):
+        def validate_padding_bytes(self, value, padding_bytes):
+            pass
+
+    decoder = LenientUnsignedIntegerDecoder(value_bit_size=8)
+    stream = ContextFramesBytesIO(b'\x01' * 32)
+
+    assert decoder(stream) == 1
+
+
+@decoder_settings
 @given(
     integer_bit_size=st.integers(min_value=1, max_value=32).map(lambda v: v * 8),
-    stream_bytes=st.binary(min_size=0, max_size=32),
+    stream_bytes=st.binary(min_size=32, max_size=32),
     data_byte_size=st.integers(min_value=0, max_value=32),
 )
 @example(8, b'\x00\x80', 2)
 @example(8, b'\xff\xff', 2)
+@example(256, b'\x80' + b'\x00' * 31, 32)
+@example(8, b'\xff' * 31 + b'\x80', 32)
+@example(8, b'\x00' * 31 + b'\x80', 32)
 def test_decode_signed_int(integer_bit_size, stream_bytes, data_byte_size):
-    if integer_bit_size % 8 != 0:
-        with pytest.raises(ValueError):
-            SignedIntegerDecoder(
-                value_bit_size=integer_bit_size,
-                data_byte_size=data_byte_size,
-            )
-        return
-    elif integer_bit_size > data_byte_size * 8:
-        with pytest.raises(ValueError):
-            SignedIntegerDecoder(
-                value_bit_size=integer_bit_size,
-                data_byte_size=data_byte_size,
-            )
-        return
-    else:
-        decoder = SignedIntegerDecoder(
+    is_valid_size = (
+        integer_bit_size % 8 == 0 and
+        integer_bit_size <= data_byte_size * 8
+    )
+
+    try:
+        decoder = cached_decoder(
+            SignedIntegerDecoder,
             value_bit_size=integer_bit_size,
             data_byte_size=data_byte_size,
         )
+    except ValueError:
+        assert not is_valid_size
+        return
+
+    assert is_valid_size
 
     stream = ContextFramesBytesIO(stream_bytes)
 
     padding_bytes = data_byte_size - integer_bit_size // 8
 
-    raw_value = big_endian_to_int(stream_bytes[padding_bytes:data_byte_size])
-    if raw_value >= 2 ** (integer_bit_size - 1):
-        actual_value = raw_value - 2 ** integer_bit_size
-    else:
-        actual_value = raw_value
+    actual_value = int.from_bytes(
+        stream_bytes[padding_bytes:data_byte_size],
+        'big',
+        signed=True,
+    )
 
-    if len(stream_bytes) < data_byte_size:
-        with pytest.raises(InsufficientDataBytes):
-            decoder(stream)
-        return
-    elif (
-        (actual_value >= 0 and not all_bytes_equal(stream_bytes[:padding_bytes], 0)) or
-        (actual_value < 0 and not all_bytes_equal(stream_bytes[:padding_bytes], 255))
+    if (
+        (actual_value >= 0 and stream_bytes[:padding_bytes] != b'\x00' * padding_bytes) or
+        (actual_value < 0 and stream_bytes[:padding_bytes] != b'\xff' * padding_bytes)
     ):
         with pytest.raises(NonEmptyPaddingBytes):
             decoder(stream)
@@ -196,7 +215,7 @@ def test_decode_signed_int(integer_bit_size, stream_bytes, data_byte_size):
     assert decoded_value == actual_value
 
 
-@settings(max_examples=250)
+@decoder_settings
 @given(
     _bytes=st.binary(min_size=0, max_size=256),
     pad_size=st.integers(min_value=0, max_value=32),
@@ -207,7 +226,7 @@ def test_decode_bytes(_bytes, pad_size):
     stream_bytes = size_bytes + padded_bytes
     stream = ContextFramesBytesIO(stream_bytes)
 
-    decoder = ByteStringDecoder()
+    decoder = cached_decoder(ByteStringDecoder)
 
     if len(padded_bytes) < ceil32(len(_bytes)):
         with pytest.raises(InsufficientDataBytes):
@@ -218,7 +237,7 @@ def test_decode_bytes(_bytes, pad_size):
     assert decoded_value == _bytes
 
 
-@settings(max_examples=250)
+@decoder_settings
 @given(
     _strings=st.text(min_size=0, max_size=256).filter(is_utf8_encodable),
     pad_size=st.integers(min_value=0, max_value=32),
@@ -229,7 +248,7 @@ def test_decode_strings(_strings, pad_size):
     stream_bytes = size_bytes + padded_bytes
     stream = ContextFramesBytesIO(stream_bytes)
 
-    decoder = StringDecoder()
+    decoder = cached_decoder(StringDecoder)
 
     if len(padded_bytes) < ceil32(len(_strings.encode("utf-8"))):
         with pytest.raises(InsufficientDataBytes):
@@ -240,7 +259,7 @@ def test_decode_strings(_strings, pad_size):
     assert decoded_value == _strings
 
 
-@settings(max_examples=250)
+@decoder_settings
 @given(
     _bytes=st.binary(min_size=0, max_size=256).filter(complement(is_utf8_decodable)),
     pad_size=st.integers(min_value=0, max_value=32),
@@ -251,7 +270,7 @@ def test_decode_strings_raises(_bytes, pad_size):
     stream_bytes = size_bytes + padded_bytes
     stream = ContextFramesBytesIO(stream_bytes)
 
-    decoder = StringDecoder()
+    decoder = cached_decoder(StringDecoder)
 
     if len(padded_bytes) < ceil32(len(_bytes)):
         with pytest.raises(InsufficientDataBytes):
@@ -262,23 +281,21 @@ def test_decode_strings_raises(_bytes, pad_size):
         decoder(stream)
 
 
-@settings(max_examples=250)
+@decoder_settings
 @given(
-    stream_bytes=st.binary(min_size=1, max_size=32),
+    stream_bytes=st.binary(min_size=32, max_size=32),
     data_byte_size=st.integers(min_value=1, max_value=32),
 )
+@example(b'\x00' * 31 + b'\x01', 32)
+@example(b'\x00' * 31 + b'\x02', 32)
+@example(b'\x01' + b'\x00' * 31, 32)
 def test_decode_boolean(stream_bytes, data_byte_size):
     stream = ContextFramesBytesIO(stream_bytes)
 
-    decoder = BooleanDecoder(data_byte_size=data_byte_size)
-
-    if len(stream_bytes) < data_byte_size:
-        with pytest.raises(InsufficientDataBytes):
-            decoder(stream)
-        return
+    decoder = cached_decoder(BooleanDecoder, data_byte_size=data_byte_size)
 
-    padding_bytes = stream_bytes[:data_byte_size][:-1]
-    if is_non_empty_non_null_byte_string(padding_bytes):
+    padding_bytes = stream_bytes[:data_byte_size - 1]
+    if padding_bytes.count(0) != len(padding_bytes):
         with pytest.raises(NonEmptyPaddingBytes):
             decoder(stream)
         return
@@ -298,22 +315,27 @@ def test_decode_boolean(stream_bytes, data_byte_size):
     assert decoded_value is actual_value
 
 
-@settings(max_examples=250)
+@decoder_settings
 @given(
     value_byte_size=st.integers(min_value=1, max_value=32),
-    stream_bytes=st.binary(min_size=0, max_size=32),
+    stream_bytes=st.binary(min_size=32, max_size=32),
     data_byte_size=st.integers(min_value=0, max_value=32),
 )
+@example(32, b'\xff' * 32, 32)
+@example(1, b'\x01' + b'\x00' * 31, 32)
+@example(1, b'\x01' + b'\x00' * 30 + b'\x01', 32)
 def test_decode_bytes_xx(value_byte_size, stream_bytes, data_byte_size):
     if value_byte_size > data_byte_size:
         with pytest.raises(ValueError):
-            BytesDecoder(
+            cached_decoder(
+                BytesDecoder,
                 value_bit_size=value_byte_size * 8,
                 data_byte_size=data_byte_size,
             )
         return
     else:
-        decoder = BytesDecoder(
+        decoder = cached_decoder(
+            BytesDecoder,
             value_bit_size=value_byte_size * 8,
             data_byte_size=data_byte_size,
         )
@@ -322,11 +344,7 @@ def test_decode_bytes_xx(value_byte_size, stream_bytes, data_byte_size):
     actual_value = stream_bytes[:value_byte_size]
     padding_bytes = stream_bytes[value_byte_size:data_byte_size]
 
-    if len(stream_bytes) < data_byte_size:
-        with pytest.raises(InsufficientDataBytes):
-            decoder(stream)
-        return
-    elif is_non_empty_non_null_byte_string(padding_bytes):
+    if is_non_empty_non_null_byte_string(padding_bytes):
         with pytest.raises(NonEmptyPaddingBytes):
             decoder(stream)
         return
@@ -336,27 +354,64 @@ def test_decode_bytes_xx(value_byte_size, stream_bytes, data_byte_size):
     assert decoded_value == actual_value
 
 
-@settings(max_examples=250)
+@pytest.mark.parametrize(
+    'decoder_class,decoder_kwargs',
+    (
+        (UnsignedIntegerDecoder, {'value_bit_size': 8}),
+        (SignedIntegerDecoder, {'value_bit_size': 8}),
+        (BooleanDecoder, {}),
+        (BytesDecoder, {'value_bit_size': 8}),
+        (UnsignedFixedDecoder, {'value_bit_size': 8, 'frac_places': 1}),
+        (SignedFixedDecoder, {'value_bit_size': 8, 'frac_places': 1}),
+    ),
+)
+@settings(max_examples=50, deadline=None)
+@given(
+    stream_bytes=st.binary(min_size=0, max_size=31),
+    data_byte_size=st.integers(min_value=1, max_value=32),
+)
+def test_decode_fixed_size_with_insufficient_data(decoder_class,
+                                                  decoder_kwargs,
+                                                  stream_bytes,
+                                                  data_byte_size):
+    # The property tests above always supply a full 32 byte stream so the
+    # short stream case is covered separately here
+    decoder = cached_decoder(
+        decoder_class,
+        data_byte_size=data_byte_size,
+        **decoder_kwargs,
+    )
+    stream = ContextFramesBytesIO(stream_bytes[:data_byte_size - 1])
+
+    with pytest.raises(InsufficientDataBytes):
+        decoder(stream)
+
+
+@decoder_settings
 @given(
     address_bytes=st.binary(min_size=0, max_size=32),
     padding_size=st.integers(min_value=10, max_value=14),
     data_byte_size=st.integers(min_value=0, max_value=32),
 )
+@example(b'\xff' * 20, 12, 32)
+@example(b'\x01' + b'\xff' * 20, 11, 32)
 def test_decode_address(address_bytes, padding_size, data_byte_size):
     stream_bytes = b'\x00' * padding_size + address_bytes
     if data_byte_size < 20:
         with pytest.raises(ValueError):
-            AddressDecoder(
+            cached_decoder(
+                AddressDecoder,
                 data_byte_size=data_byte_size,
             )
         return
     else:
-        decoder = AddressDecoder(
+        decoder = cached_decoder(
+            AddressDecoder,
             data_byte_size=data_byte_size,
         )
 
     stream = ContextFramesBytesIO(stream_bytes)
-    padding_bytes = stream_bytes[:data_byte_size][:-20]
+    padding_bytes = stream_bytes[:data_byte_size - 20]
 
     if len(stream_bytes) < data_byte_size:
         with pytest.raises(InsufficientDataBytes):
@@ -369,12 +424,29 @@ def test_decode_address(address_bytes, padding_size, data_byte_size):
     else:
         decoded_value = decoder(stream)
 
-    actual_value = to_normalized_address(stream_bytes[:data_byte_size][-20:])
+    actual_value = to_normalized_address(stream_bytes[data_byte_size - 20:data_byte_size])
 
     assert decoded_value == actual_value
 
 
-@settings(max_examples=250)
+@pytest.mark.parametrize(
+    'address_bytes',
+    (
+        b'\x00' * 20,
+        b'\xff' * 20,
+        # Checksums to mixed case
+        decode_hex('0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed'),
+        decode_hex('0xfB6916095ca1df60bB79Ce92cE3Ea74c37c5d359'),
+    ),
+)
+def test_decode_address_matches_normalized_address(address_bytes):
+    decoder = AddressDecoder()
+    stream = ContextFramesBytesIO(b'\x00' * 12 + address_bytes)
+
+    assert decoder(stream) == to_normalized_address(address_bytes)
+
+
+@decoder_settings
 @given(
     array_size=st.integers(min_value=0, max_value=32),
     array_values=st.lists(
@@ -382,25 +454,95 @@ def test_decode_address(address_bytes, padding_size, data_byte_size):
         min_size=0, max_size=64,
     ).map(tuple),
 )
+@example(0, ())
+@example(2, (TT256M1, 0))
+@example(3, (TT256M1, 0))
 def test_decode_array_of_unsigned_integers(array_size, array_values):
-    size_bytes = zpad32(int_to_big_endian(array_size))
-    values_bytes = b''.join((
-        zpad32(int_to_big_endian(v)) for v in array_values
-    ))
-    stream_bytes = size_bytes + values_bytes
+    stream_bytes = bytearray(32 * (len(array_values) + 1))
+    stream_bytes[:32] = array_size.to_bytes(32, 'big')
+    for i, v in enumerate(array_values, 1):
+        stream_bytes[i * 32:(i + 1) * 32] = v.to_bytes(32, 'big')
+
+    decoder = cached_decoder(
+        DynamicArrayDecoder,
+        item_decoder=cached_decoder(UnsignedIntegerDecoder, value_bit_size=256),
+    )
+    stream = ContextFramesBytesIO(stream_bytes)
+
+    if len(array_values) < array_size:
+        with pytest.raises(InsufficientDataBytes):
+            decoder(stream)
+        return
+
+    actual_values = decoder(stream)
+    assert actual_values == array_values[:array_size]
+
+
+def test_decode_array_of_unsigned_integers_with_oversized_length():
+    stream_bytes = zpad32(int_to_big_endian(TT256M1)) + b'\x00' * 64
 
     decoder = DynamicArrayDecoder(
         item_decoder=UnsignedIntegerDecoder(value_bit_size=256),
     )
     stream = ContextFramesBytesIO(stream_bytes)
 
-    if len(array_values) < array_size:
+    with pytest.raises(InsufficientDataBytes):
+        decoder(stream)
+
+
+def test_decode_short_array_of_unsigned_integers_checks_padding_first():
+    # Matches decoding item by item: the complete first item has bad padding
+    # which is reported before the missing second item
+    stream_bytes = b'\x01' * 32 + b'\x00' * 16
+
+    decoder = SizedArrayDecoder(
+        array_size=2,
+        item_decoder=UnsignedIntegerDecoder(value_bit_size=8),
+    )
+    stream = ContextFramesBytesIO(stream_bytes)
+
+    with pytest.raises(NonEmptyPaddingBytes):
+        decoder(stream)
+
+
+@decoder_settings
+@given(
+    integer_bit_size=st.integers(min_value=1, max_value=32).map(lambda v: v * 8),
+    array_size=st.integers(min_value=0, max_value=8),
+    array_values=st.lists(
+        st.integers(min_value=0, max_value=TT256M1),
+        min_size=0, max_size=8,
+    ),
+)
+def test_decode_sized_array_of_unsigned_integers(integer_bit_size, array_size, array_values):
+    stream_bytes = b''.join((
+        v.to_bytes(32, 'big') for v in array_values
+    ))
+
+    decoder = cached_decoder(
+        SizedArrayDecoder,
+        array_size=array_size,
+        item_decoder=cached_decoder(
+            UnsignedIntegerDecoder,
+            value_bit_size=integer_bit_size,
+        ),
+    )
+    stream = ContextFramesBytesIO(stream_bytes)
+
+    # Items are checked in order so bad padding in any available item is
+    # reported before a missing one
+    if any(v >= POWERS_OF_TWO[integer_bit_size] for v in array_values[:array_size]):
+        with pytest.raises(NonEmptyPaddingBytes):
+            decoder(stream)
+        return
+    elif len(array_values) < array_size:
         with pytest.raises(InsufficientDataBytes):
             decoder(stream)
         return
 
     actual_values = decoder(stream)
-    assert actual_values == array_values[:array_size]
+    assert actual_values == tuple(array_values[:array_size])
+    assert stream.tell() == 32 * array_size
 
 
 @pytest.mark.parametrize(
@@ -436,70 +578,38 @@ def test_tuple_decoder(types, data, expected):
     assert actual == expected
 
 
-@settings(max_examples=250)
-@given(
-    value_bit_size=st.integers(min_value=1, max_value=32).map(lambda v: v * 8),
-    frac_places=st.integers(min_value=1, max_value=80),
-    stream_bytes=st.binary(min_size=0, max_size=32),
-    data_byte_size=st.integers(min_value=0, max_value=32),
+@pytest.mark.parametrize(
+    'decoder_class,signed',
+    (
+        (UnsignedFixedDecoder, False),
+        (SignedFixedDecoder, True),
+    ),
 )
-def test_decode_unsigned_fixed(value_bit_size,
-                               frac_places,
-                               stream_bytes,
-                               data_byte_size):
-    if value_bit_size > data_byte_size * 8:
-        with pytest.raises(ValueError):
-            UnsignedFixedDecoder(
-                value_bit_size=value_bit_size,
-                frac_places=frac_places,
-                data_byte_size=data_byte_size,
-            )
-        return
-
-    decoder = UnsignedFixedDecoder(
-        value_bit_size=value_bit_size,
-        frac_places=frac_places,
-        data_byte_size=data_byte_size,
-    )
-
-    stream = ContextFramesBytesIO(stream_bytes)
-    padding_bytes = stream_bytes[:data_byte_size][:data_byte_size - value_bit_size // 8]
-
-    if len(stream_bytes) < data_byte_size:
-        with pytest.raises(InsufficientDataBytes):
-            decoder(stream)
-        return
-
-    if is_non_empty_non_null_byte_string(padding_bytes):
-        with pytest.raises(NonEmptyPaddingBytes):
-            decoder(stream)
-        return
-
-    # Ensure no exceptions
-    decoder(stream)
-
-
-@settings(max_examples=250)
+@decoder_settings
 @given(
     value_bit_size=st.integers(min_value=1, max_value=32).map(lambda v: v * 8),
     frac_places=st.integers(min_value=1, max_value=80),
-    stream_bytes=st.binary(min_size=0, max_size=32),
+    stream_bytes=st.binary(min_size=32, max_size=32),
     data_byte_size=st.integers(min_value=0, max_value=32),
 )
-def test_decode_signed_fixed(value_bit_size,
-                             frac_places,
-                             stream_bytes,
-                             data_byte_size):
+def test_decode_fixed(decoder_class,
+                      signed,
+                      value_bit_size,
+                      frac_places,
+                      stream_bytes,
+                      data_byte_size):
     if value_bit_size > data_byte_size * 8:
         with pytest.raises(ValueError):
-            SignedFixedDecoder(
+            cached_decoder(
+                decoder_class,
                 value_bit_size=value_bit_size,
                 frac_places=frac_places,
                 data_byte_size=data_byte_size,
             )
         return
 
-    decoder = SignedFixedDecoder(
+    decoder = cached_decoder(
+        decoder_class,
         value_bit_size=value_bit_size,
         frac_places=frac_places,
         data_byte_size=data_byte_size,
@@ -508,24 +618,23 @@ def test_decode_signed_fixed(value_bit_size,
     stream = ContextFramesBytesIO(stream_bytes)
 
     padding_offset = data_byte_size - value_bit_size // 8
-    data_offset = padding_offset + value_bit_size // 8
 
-    padding_bytes = stream_bytes[:data_byte_size][:padding_offset]
-    data_bytes = stream_bytes[:data_byte_size][padding_offset:data_offset]
+    padding_bytes = stream_bytes[:padding_offset]
+    data_bytes = stream_bytes[padding_offset:data_byte_size]
 
-    if len(stream_bytes) < data_byte_size:
-        with pytest.raises(InsufficientDataBytes):
-            decoder(stream)
-        return
+    if signed:
+        has_invalid_padding = not is_valid_padding_bytes(padding_bytes, data_bytes)
+    else:
+        has_invalid_padding = is_non_empty_non_null_byte_string(padding_bytes)
 
-    if not is_valid_padding_bytes(padding_bytes, data_bytes):
+    if has_invalid_padding:
         with pytest.raises(NonEmptyPaddingBytes):
             decoder(stream)
         return
 
     actual_value = decoder(stream)
 
-    if padding_bytes:
+    if signed and padding_bytes:
         if actual_value >= 0:
             assert bytes(set(padding_bytes)) == b'\x00'
         else:
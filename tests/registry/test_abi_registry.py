@@ -62,6 +62,8 @@ def test_cache_resets_after_register_and_register_works(registry: ABIRegistry):
     # Populate cache
     registry.get_encoder('address')
     registry.get_decoder('address')
+    registry.get_tuple_encoder('address')
+    registry.get_tuple_decoder('address')
 
     # Perform cache resetting action
     registry.register(
@@ -75,12 +77,18 @@ def test_cache_resets_after_register_and_register_works(registry: ABIRegistry):
         registry.get_encoder('address')
     with pytest.raises(exceptions.MultipleEntriesFound):
         registry.get_decoder('address')
+    with pytest.raises(exceptions.MultipleEntriesFound):
+        registry.get_tuple_encoder('address')
+    with pytest.raises(exceptions.MultipleEntriesFound):
+        registry.get_tuple_decoder('address')
 
 
 def test_cache_resets_after_unregister_and_unregister_works(registry: ABIRegistry):
     # Populate cache
     registry.get_encoder('address')
     registry.get_decoder('address')
+    registry.get_tuple_encoder('address')
+    registry.get_tuple_decoder('address')
 
     # Perform cache resetting action
     registry.unregister('address')
@@ -90,6 +98,26 @@ def test_cache_resets_after_unregister_and_unregister_works(registry: ABIRegistr
         registry.get_encoder('address')
     with pytest.raises(exceptions.NoEntriesFound):
         registry.get_decoder('address')
+    with pytest.raises(exceptions.NoEntriesFound):
+        registry.get_tuple_encoder('address')
+    with pytest.raises(exceptions.NoEntriesFound):
+        registry.get_tuple_decoder('address')
+
+
+def test_get_tuple_encoder_reuses_encoder_for_same_types(registry: ABIRegistry):
+    encoder = registry.get_tuple_encoder('address', 'address[]')
+
+    assert isinstance(encoder, encoding.TupleEncoder)
+    assert registry.get_tuple_encoder('address', 'address[]') is encoder
+    assert registry.get_tuple_encoder('address') is not encoder
+
+
+def test_get_tuple_decoder_reuses_decoder_for_same_types(registry: ABIRegistry):
+    decoder = registry.get_tuple_decoder('address', 'address[]')
+
+    assert isinstance(decoder, decoding.TupleDecoder)
+    assert registry.get_tuple_decoder('address', 'address[]') is decoder
+    assert registry.get_tuple_decoder('address') is not decoder
 
 
 def test_can_register_and_unregister_string_lookups(registry: ABIRegistry):